@@ -9,7 +9,6 @@ Run from the root of your Java project.
 import os
 import re
 import sys
-import shutil
 from pathlib import Path
 from typing import Dict
 
@@ -6,37 +6,156 @@ Generates a complete Retrofit API client using external template files.
 Run from the root of your Java project.
 """
 
+import importlib.util
+import io
+import json
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict
 
 try:
     import click
-    from ruamel.yaml import YAML
 except ImportError:
     print("Error: Required dependencies not installed.")
     print("Please run: pip install retrofit-generator")
     sys.exit(1)
 
-# Handle template directory resolution for installed package
-try:
-    # Python 3.9+
+# Handle template directory resolution for installed package; the version is
+# probed once so a normal startup doesn't go through failed imports
+if not __package__:
+    # Run as a plain script: templates sit next to this file
+    TEMPLATE_DIR = Path(__file__).parent / 'templates'
+elif sys.version_info >= (3, 9):
     from importlib.resources import files
-    TEMPLATE_DIR = files('retrofit_generator') / 'templates'
-except (ImportError, AttributeError):
-    # Python 3.7-3.8 fallback
+    TEMPLATE_DIR = files(__package__) / 'templates'
+else:
+    # Python 3.7-3.8 use the importlib-resources backport
     try:
-        import importlib_resources
-        TEMPLATE_DIR = importlib_resources.files('retrofit_generator') / 'templates'
+        from importlib_resources import files
+        TEMPLATE_DIR = files(__package__) / 'templates'
     except ImportError:
         # Development mode fallback
         TEMPLATE_DIR = Path(__file__).parent / 'templates'
 
+# Patterns used to locate insertion points in configuration classes
+# RestClientConfig.java is scanned once for the last import, the last bean and
+# whether the API's bean already exists; a (?P<sig>...) branch is added per API
+_REST_SCAN_PATTERN = (
+    r'(?P<imp>^import [^\n]+;$)'
+    r'|(?P<bean>@Bean\s+public\s+\w+.*?\n\s+\})'
+)
+_BEAN_RE_ENDPOINTS = re.compile(r'@Bean\s+.*?\n\s+\}', re.DOTALL)
+_CLASS_TAIL_RE = re.compile(r'(  \}\n)(\}\s*$)')
+
+# Position before each uppercase letter except the first, for kebab-case conversion
+_KEBAB_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+# Patterns used by the text fast path for application-local.yml
+_YAML_TOP_LEVEL_RE = re.compile(r'^(?=[^\s#])', re.MULTILINE)
+_YAML_NESTED_LINE_RE = re.compile(r'^[ \t]+\S.*$', re.MULTILINE)
+_YAML_DOCUMENT_MARKER_RE = re.compile(r'^(?:---|\.\.\.)(?=[ \t]|$)', re.MULTILINE)
+_YAML_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z][^\s#\'"]*(?<!:)')
+_YAML_KEY_RE = re.compile(r'[A-Za-z][A-Za-z0-9_.-]*')
+# Bare words that YAML 1.1 loaders such as Spring's read back as booleans or null
+_YAML_NON_STRING_WORDS = frozenset({'y', 'n', 'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+_YAML_SECTION_HEADER_RES = {
+    section: re.compile(rf'^{re.escape(section)}:[ \t]*(?:#.*)?$', re.MULTILINE)
+    for section in ('http-client', 'credentials')
+}
+
+# Line ending written to generated files, matching what text mode would produce
+_NATIVE_NEWLINE = os.linesep.encode('ascii')
+
+# Exclusive binary create for generated files
+_OUTPUT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# ruamel.yaml is slow to import and only needed for YAML edits, so load it lazily;
+# main() checks it is installed before any file is written
+_yaml_cls = None
+
+
+def _yaml_installed() -> bool:
+    """Return whether ruamel.yaml can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec('ruamel.yaml') is not None
+    except ImportError:
+        # The 'ruamel' namespace package itself is missing
+        return False
+
+
+def _get_yaml_class():
+    """Return ruamel.yaml's YAML class, importing it on first use."""
+    global _yaml_cls
+    if _yaml_cls is None:
+        from ruamel.yaml import YAML
+        _yaml_cls = YAML
+    return _yaml_cls
+
+
+# Edited YAML documents not yet written back, keyed by path. Batch runs apply
+# every API's edits to the buffered text and write each file once at the end.
+_pending_yaml: Dict[Path, str] = {}
+
+
+def _is_plain_yaml_string(value: str, pattern=_YAML_KEY_RE) -> bool:
+    """Return whether value can be written unquoted and still load back as the same string.
+
+    Values starting with a digit are rejected outright rather than telling
+    numbers and timestamps apart from strings.
+    """
+    return pattern.fullmatch(value) is not None and value.lower() not in _YAML_NON_STRING_WORDS
+
+
+def _safe_load_yaml(text: str):
+    """Parse YAML with the fast safe loader; None if it needs the round-trip loader."""
+    from ruamel.yaml.error import YAMLError
+    try:
+        data = _get_yaml_class()(typ='safe').load(text)
+    except YAMLError:
+        # e.g. custom tags, which only the round-trip loader accepts
+        return None
+    return {} if data is None else data
+
+
+def _load_yaml_text(yaml_path: Path) -> str:
+    """Return the current YAML text, preferring edits still buffered in memory."""
+    text = _pending_yaml.get(yaml_path)
+    if text is None:
+        text = yaml_path.read_text(encoding='utf-8')
+    return text
+
+
+def _flush_yaml():
+    """Write every buffered YAML document back to disk."""
+    while _pending_yaml:
+        yaml_path, text = _pending_yaml.popitem()
+        yaml_path.write_text(text, encoding='utf-8')
+
 
 class RetrofitClientGenerator:
     """Generates Retrofit API client from template files."""
 
+    # Discovery results shared by generators in the same process (batch mode)
+    _base_package_cache: Dict[Path, str] = {}
+    _snippet_cache: Dict[str, Dict[str, str]] = {}
+    _template_cache: Dict[str, bytes] = {}
+
+    # Content shorter than this uses the unrolled replace chain instead of a scan
+    _REPLACE_CHAIN_MAX_LEN = 2048
+
+    # Template sets smaller than this are written sequentially; below it the
+    # thread pool's startup costs more than the writes it overlaps
+    _PARALLEL_MIN_FILES = 64
+
+    # Build output and tooling directories skipped when searching for config files
+    _PRUNED_DIRS = frozenset({
+        '.git', '.idea', '.gradle', '.mvn', 'target', 'build', 'out', 'bin', 'node_modules',
+    })
+
     def __init__(
         self,
         api_name: str,
@@ -53,12 +172,24 @@ class RetrofitClientGenerator:
         self.base_url = base_url
         self.service_identifier = service_identifier
         self.project_root = project_root
-        self.template_dir = Path(template_dir) if not isinstance(template_dir, Path) else template_dir
         self.credentials = credentials
+        # Progress messages, written out in one go by _flush_log()
+        self._log = []
 
-        self.base_package = self._infer_base_package()
+        self.template_dir = Path(template_dir) if not isinstance(template_dir, Path) else template_dir
+        # String forms for the per-template hot paths
+        self._template_dir_str = os.fspath(self.template_dir)
+        self._project_root_str = os.fspath(project_root)
+
+        self._snippets = self._load_snippets()
+
+        self.base_package = self._base_package_cache.get(project_root)
+        if self.base_package is None:
+            self.base_package = self._infer_base_package()
+            self._base_package_cache[project_root] = self.base_package
         self.base_package_path = self.base_package.replace('.', '/')
         self.src_path = project_root / 'src' / 'main' / 'java' / self.base_package_path
+        self._src_path_str = os.fspath(self.src_path)
 
         # Replacement map for all placeholders
         self.replacements = {
@@ -69,6 +200,27 @@ class RetrofitClientGenerator:
             '__baseUrl__': self.base_url,
             '__serviceIdentifier__': self.service_identifier,
         }
+        # Single alternation over all placeholders, compiled on first use since
+        # only content past _REPLACE_CHAIN_MAX_LEN is scanned with it
+        self._placeholder_re = None
+        self._replace_str = self._compile_replacer(tuple(self.replacements.items()))
+        # Byte-level table so template bodies skip the decode/encode round-trip
+        self._byte_replacements = {
+            k.encode('utf-8'): v.encode('utf-8') for k, v in self.replacements.items()
+        }
+        self._byte_replacement_pairs = tuple(self._byte_replacements.items())
+        self._replace_bytes = self._compile_replacer(self._byte_replacement_pairs)
+
+        # Config snippets rendered once for this API
+        self._rest_import_stmt = self._apply_replacements(self._snippets['RestClientConfig.import.java']).strip()
+        self._rest_bean_code = self._apply_replacements(self._snippets['RestClientConfig.bean.java'])
+        self._endpoints_bean_code = self._apply_replacements(self._snippets['EndpointsConfig.bean.java'])
+        self._yaml_service_block = self._apply_replacements(self._snippets['application.yml']).rstrip('\n')
+        self._rest_bean_signature = f"{self.api_name_camel}Api()"
+        self._rest_scan_re = re.compile(
+            f"{_REST_SCAN_PATTERN}|(?P<sig>{re.escape(self._rest_bean_signature)})",
+            re.MULTILINE | re.DOTALL,
+        )
 
     @staticmethod
     def _to_camel_case(pascal_case: str) -> str:
@@ -77,13 +229,19 @@ class RetrofitClientGenerator:
             return pascal_case
         return pascal_case[0].lower() + pascal_case[1:]
 
-    @staticmethod
-    def _to_kebab_case(pascal_case: str) -> str:
-        """Convert PascalCase to kebab-case."""
-        import re
-        # Insert hyphen before uppercase letters (except the first one)
-        kebab = re.sub(r'(?<!^)(?=[A-Z])', '-', pascal_case)
-        return kebab.lower()
+    def _load_snippets(self) -> Dict[str, str]:
+        """Read config snippets once per template directory; they are small and invariant."""
+        cache_key = str(self.template_dir)
+        snippets = self._snippet_cache.get(cache_key)
+        if snippets is None:
+            snippets = {}
+            snippets_dir = self.template_dir / 'config_snippets'
+            if snippets_dir.is_dir():
+                for snippet_path in snippets_dir.iterdir():
+                    if snippet_path.is_file():
+                        snippets[snippet_path.name] = self._read_template(snippet_path)
+            self._snippet_cache[cache_key] = snippets
+        return snippets
 
     def _infer_base_package(self) -> str:
         """Infer base package by finding the package containing a 'client' directory."""
@@ -92,243 +250,531 @@ class RetrofitClientGenerator:
         if not src_java.exists():
             raise FileNotFoundError(f"Could not find src/main/java in {self.project_root}")
 
-        for root, dirs, _ in os.walk(src_java):
-            if 'client' in dirs:
-                relative_path = Path(root).relative_to(src_java)
-                package = str(relative_path).replace(os.sep, '.')
-                click.echo(f"✓ Detected base package: {package}")
-                return package
+        # Breadth-first scan that stops at the first directory holding 'client'
+        # and never descends into hidden directories
+        pending = deque([src_java])
+        while pending:
+            directory = pending.popleft()
+            subdirs = []
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name == 'client':
+                        relative_path = Path(directory).relative_to(src_java)
+                        package = str(relative_path).replace(os.sep, '.')
+                        self._emit(f"✓ Detected base package: {package}")
+                        return package
+                    if not entry.name.startswith('.'):
+                        subdirs.append(entry.path)
+            pending.extend(subdirs)
 
         raise FileNotFoundError("Could not find a package containing 'client' directory")
 
     def _apply_replacements(self, content: str) -> str:
         """Apply all placeholder replacements to content."""
-        for placeholder, value in self.replacements.items():
-            content = content.replace(placeholder, value)
-        return content
-
-    def _read_template(self, template_path):
-        """Read template content, handling both Path and resource objects."""
-        if hasattr(template_path, 'read_text'):
-            return template_path.read_text(encoding='utf-8')
-        else:
-            return Path(template_path).read_text(encoding='utf-8')
-
-    def _process_template_file(self, template_path, output_path: Path):
-        """Process a single template file and write to output."""
-        if output_path.exists():
-            click.echo(f"⚠️  {output_path.relative_to(self.project_root)} already exists, skipping...")
-            return
-
-        # Read template
-        content = self._read_template(template_path)
-
-        # Apply replacements
-        content = self._apply_replacements(content)
-
-        # Create output directory
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write output
-        output_path.write_text(content, encoding='utf-8')
-        click.echo(f"✓ Created: {output_path.relative_to(self.project_root)}")
+        # Every placeholder starts with '__', so content without it has nothing to replace
+        if '__' not in content:
+            return content
+        # Short strings (file names, snippets) are cheaper with plain replace calls
+        # than with setting up a regex scan
+        if len(content) < self._REPLACE_CHAIN_MAX_LEN:
+            return self._replace_str(content)
+        if self._placeholder_re is None:
+            self._placeholder_re = re.compile('|'.join(re.escape(k) for k in self.replacements))
+        # Default argument keeps the lookup a fast local inside the callback
+        lookup = self.replacements.__getitem__
+        return self._placeholder_re.sub(lambda m, lookup=lookup: lookup(m.group()), content)
+
+    def _read_template(self, template_path: Path) -> str:
+        """Read template content."""
+        return template_path.read_text(encoding='utf-8')
+
+    def _render_template(self, template_path: str) -> bytes:
+        """Read a template file and return its bytes with placeholders and newlines applied."""
+        # Templates are kept with normalized newlines for later generators (batch mode)
+        cache_key = template_path
+        data = self._template_cache.get(cache_key)
+        if data is None:
+            with open(template_path, 'rb') as f:
+                data = self._normalize_newlines(f.read())
+            self._template_cache[cache_key] = data
+        return self._apply_replacements_bytes(data)
 
-    def _iter_templates(self, template_subdir):
-        """Iterate over template files, handling both filesystem and package resources."""
-        template_path = Path(template_subdir) if not isinstance(template_subdir, Path) else template_subdir
+    @staticmethod
+    def _normalize_newlines(data: bytes) -> bytes:
+        """Translate template line endings the way text-mode I/O would."""
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        if _NATIVE_NEWLINE != b'\n':
+            data = data.replace(b'\n', _NATIVE_NEWLINE)
+        return data
 
-        if template_path.exists() and template_path.is_dir():
-            # Regular filesystem
-            for item in template_path.rglob('*.java'):
-                yield item
-        else:
-            # Package resource
-            try:
-                for item in template_subdir.rglob('*.java'):
-                    yield item
-            except AttributeError:
-                # Fallback for older resource APIs
-                pass
-
-    def _process_template_directory(self, template_subdir, output_base: Path):
-        """Recursively process all template files in a directory."""
-        for template_file in self._iter_templates(template_subdir):
-            # Get relative path
+    @staticmethod
+    def _compile_replacer(pairs):
+        """Generate a function with one unrolled replace call per placeholder.
+
+        Works for both str and bytes pairs.
+
+        The placeholder set is fixed once the generator is built, so the values
+        are baked in as literals (via repr) instead of being looked up per call.
+        """
+        lines = ['def replace(data):']
+        for placeholder, value in pairs:
+            lines.append(f'    data = data.replace({placeholder!r}, {value!r})')
+        lines.append('    return data')
+        namespace = {}
+        exec('\n'.join(lines), namespace)
+        return namespace['replace']
+
+    def _apply_replacements_bytes(self, data: bytes) -> bytes:
+        """Apply all placeholder replacements to raw template bytes."""
+        if b'__' not in data:
+            return data
+        return self._replace_bytes(data)
+
+    def _process_template_file(self, template_path: str, output_path: str) -> str:
+        """Process a single template file and write to output.
+
+        The output directory must already exist. Returns the status message
+        so callers running files concurrently can report results in template
+        order.
+        """
+        # Exclusive create doubles as the existence check; the rendered bytes are
+        # written straight to the descriptor, skipping the buffered file layer
+        try:
+            fd = os.open(output_path, _OUTPUT_OPEN_FLAGS, 0o666)
+        except FileExistsError:
+            return f"⚠️  {os.path.relpath(output_path, self._project_root_str)} already exists, skipping..."
+
+        try:
             try:
-                if hasattr(template_subdir, '__fspath__'):
-                    rel_path = template_file.relative_to(template_subdir)
-                else:
-                    # For package resources
-                    rel_path = Path(str(template_file).replace(str(template_subdir) + os.sep, ''))
-            except (ValueError, AttributeError):
-                # Extract relative path from string representation
-                template_str = str(template_file)
-                subdir_str = str(template_subdir)
-                if subdir_str in template_str:
-                    rel_path = Path(template_str.split(subdir_str)[-1].lstrip(os.sep))
-                else:
-                    rel_path = Path(template_file.name)
-
-            # Apply replacements to filename
-            output_filename = self._apply_replacements(str(rel_path))
-
-            # Determine output path
-            output_path = output_base / output_filename
+                # Read template and apply replacements
+                content = memoryview(self._render_template(template_path))
+
+                # Write output; os.write may accept fewer bytes than offered
+                while content:
+                    content = content[os.write(fd, content):]
+            finally:
+                os.close(fd)
+        except BaseException:
+            # Don't leave a partial file behind that later runs would skip as existing
+            os.unlink(output_path)
+            raise
+        return f"✓ Created: {os.path.relpath(output_path, self._project_root_str)}"
+
+    def _collect_template_files(self, routes: Dict[str, str]):
+        """Walk the template tree once, pairing each template with its output path.
+
+        ``routes`` maps a top-level template directory to the output base it
+        generates into; other top-level directories are skipped.
+        """
+        pairs = []
+        for name, output_base in routes.items():
+            subdir = os.path.join(self._template_dir_str, name)
+            if not os.path.isdir(subdir):
+                continue
+            prefix_len = len(subdir) + len(os.sep)
+            for template_file in self._iter_templates(subdir):
+                # Apply replacements to the path relative to the routed directory
+                output_filename = self._apply_replacements(template_file[prefix_len:])
+                pairs.append((template_file, os.path.join(output_base, output_filename)))
+        return pairs
 
-            # Process the file
-            self._process_template_file(template_file, output_path)
-
-    def generate_all(self):
-        """Generate all files and configurations."""
-        click.echo(f"\n🚀 Generating Retrofit client for: {self.api_name_pascal}")
-        click.echo(f"   Base package: {self.base_package}")
-        click.echo(f"   Endpoint: {self.endpoint_path}\n")
-
-        # Process all template directories
-        self._generate_java_files()
-        self._modify_config_files()
+    @staticmethod
+    def _iter_templates(template_subdir: str):
+        """Yield the path of every .java template under template_subdir, as strings.
+
+        Walks depth-first with os.scandir in the same pre-order as os.walk.
+        """
+        stack = [template_subdir]
+        while stack:
+            subdirs = []
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith('.java'):
+                        yield entry.path
+            stack.extend(reversed(subdirs))
+
+    def _process_template_files(self, pairs):
+        """Process (template, output) pairs and report each result."""
+        # Many templates share an output directory; create each one only once
+        for output_dir in {os.path.dirname(output_path) for _, output_path in pairs}:
+            os.makedirs(output_dir, exist_ok=True)
+
+        if len(pairs) < self._PARALLEL_MIN_FILES:
+            self._log.extend(self._process_template_file(*pair) for pair in pairs)
+            return
 
-        click.echo(f"\n✅ Successfully generated {self.api_name_pascal} Retrofit client!")
+        # Large sets are I/O bound and independent, so overlap the writes
+        max_workers = min(8, len(pairs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self._log.extend(executor.map(lambda pair: self._process_template_file(*pair), pairs))
+
+    def _emit(self, message: str):
+        """Queue a progress message for the next _flush_log()."""
+        self._log.append(message)
+
+    def _flush_log(self):
+        """Write all queued progress messages with a single echo."""
+        if self._log:
+            click.echo('\n'.join(self._log))
+            self._log.clear()
+
+    def generate_all(self, flush_yaml: bool = True):
+        """Generate all files and configurations.
+
+        Pass ``flush_yaml=False`` to keep YAML edits buffered for a later
+        ``_flush_yaml()`` call, so batch runs write each file once.
+        Progress messages are written once at the end, including when a step
+        fails, so they still precede the error report.
+        """
+        try:
+            self._emit(f"\n🚀 Generating Retrofit client for: {self.api_name_pascal}")
+            self._emit(f"   Base package: {self.base_package}")
+            self._emit(f"   Endpoint: {self.endpoint_path}\n")
+
+            # Process all template directories
+            self._generate_java_files()
+            self._modify_config_files()
+            if flush_yaml:
+                _flush_yaml()
+
+            self._emit(f"\n✅ Successfully generated {self.api_name_pascal} Retrofit client!")
+        finally:
+            self._flush_log()
 
     def _generate_java_files(self):
         """Generate all Java files from templates."""
-        click.echo("📝 Generating Java files...")
-
-        # Process client templates
-        client_templates = self.template_dir / 'client'
-        self._process_template_directory(client_templates, self.src_path / 'client')
+        self._emit("📝 Generating Java files...")
 
-        # Process domain templates
-        domain_templates = self.template_dir / 'domain'
-        self._process_template_directory(domain_templates, self.src_path / 'domain')
+        routes = {
+            'client': os.path.join(self._src_path_str, 'client'),
+            'domain': os.path.join(self._src_path_str, 'domain'),
+        }
+        self._process_template_files(self._collect_template_files(routes))
 
     def _modify_config_files(self):
         """Modify configuration files with snippets."""
-        click.echo("\n⚙️  Updating configuration files...")
+        self._emit("\n⚙️  Updating configuration files...")
+
+        config_paths = self._resolve_config_paths()
+        self._add_to_rest_client_config(config_paths['RestClientConfig.java'])
+        self._add_to_endpoints_config(config_paths['EndpointsConfig.java'])
+        self._add_to_application_yaml(config_paths['application-local.yml'])
+
+    def _resolve_config_paths(self) -> Dict[str, Path]:
+        """Locate the three configuration files, searching for all missing ones at once.
+
+        Files found at their default location are used as is; the others share
+        a single project walk. Files that can't be found map to None.
+        """
+        paths = {
+            'RestClientConfig.java': self.src_path / 'config' / 'RestClientConfig.java',
+            'EndpointsConfig.java': self.src_path / 'config' / 'endpoints' / 'EndpointsConfig.java',
+            'application-local.yml': self.project_root / 'src' / 'main' / 'resources' / 'application-local.yml',
+        }
+        missing = [filename for filename, path in paths.items() if not path.exists()]
+        if missing:
+            for filename in missing:
+                self._emit(f"⚠️  {filename} not found at default location, searching...")
+            found = self._find_file_recursive(missing, self.project_root)
+            for filename in missing:
+                paths[filename] = found.get(filename)
+        return paths
 
-        self._add_to_rest_client_config()
-        self._add_to_endpoints_config()
-        self._add_to_application_yaml()
+    @staticmethod
+    def _apply_edits(content: str, edits) -> str:
+        """Insert each (offset, text) edit into content with a single join."""
+        parts = []
+        last = 0
+        for offset, text in sorted(edits, key=lambda edit: edit[0]):
+            parts.append(content[last:offset])
+            parts.append(text)
+            last = offset
+        parts.append(content[last:])
+        return ''.join(parts)
 
-    def _add_to_rest_client_config(self):
-        """Add import and bean to RestClientConfig.java."""
-        config_path = self.src_path / 'config' / 'RestClientConfig.java'
+    @staticmethod
+    def _last_match_end(pattern, content: str) -> int:
+        """Return the end offset of the last match of pattern, or -1 if none."""
+        last_end = -1
+        for match in pattern.finditer(content):
+            last_end = match.end()
+        return last_end
 
-        if not config_path.exists():
-            click.echo(f"⚠️  RestClientConfig.java not found at default location, searching...")
-            config_path = self._find_file_recursive('RestClientConfig.java', self.project_root)
-            if not config_path:
-                click.echo(f"⚠️  RestClientConfig.java not found in project")
-                return
+    @staticmethod
+    def _find_class_closing_brace(content: str) -> int:
+        """Return the offset of the class's closing brace, or -1 if not found.
+
+        The brace must directly follow a method's closing ``  }`` line. The
+        common layout is checked by scanning back from the end of the file;
+        the regex is only a fallback.
+        """
+        last_brace = content.rfind('}')
+        if (last_brace != -1 and content.endswith('  }\n', 0, last_brace)
+                and not content[last_brace + 1:].strip()):
+            return last_brace
+        class_match = _CLASS_TAIL_RE.search(content)
+        return class_match.end(1) if class_match else -1
+
+    def _add_to_rest_client_config(self, config_path: Path):
+        """Add import and bean to RestClientConfig.java."""
+        if not config_path:
+            self._emit(f"⚠️  RestClientConfig.java not found in project")
+            return
 
         content = config_path.read_text(encoding='utf-8')
 
-        # Add import
-        import_snippet_path = self.template_dir / 'config_snippets' / 'RestClientConfig.import.java'
-        import_snippet = self._read_template(import_snippet_path)
-        import_statement = self._apply_replacements(import_snippet).strip()
-
-        if import_statement not in content:
-            # Find last import and add after it
-            import_pattern = re.compile(r'^import .+;$', re.MULTILINE)
-            imports = list(import_pattern.finditer(content))
-            if imports:
-                last_import = imports[-1]
-                insert_pos = last_import.end()
-                content = content[:insert_pos] + f"\n{import_statement}" + content[insert_pos:]
-                click.echo(f"✓ Added import to RestClientConfig.java")
+        # Insertion points are computed on the original content and applied in one pass
+        edits = []
+
+        import_statement = self._rest_import_stmt
+        signature = self._rest_bean_signature
+        # A plain substring check, so an import line with a trailing comment counts
+        import_present = import_statement in content
+
+        # One pass finds both insertion points and whether the bean already exists
+        last_import_end = last_bean_end = -1
+        bean_present = False
+        for match in self._rest_scan_re.finditer(content):
+            kind = match.lastgroup
+            if kind == 'imp':
+                last_import_end = match.end()
+            elif kind == 'bean':
+                last_bean_end = match.end()
+                bean_present = bean_present or signature in match.group()
+            else:
+                bean_present = True
+
+        # Add import after the last one
+        if not import_present and last_import_end != -1:
+            edits.append((last_import_end, '\n' + import_statement))
+            self._emit(f"✓ Added import to RestClientConfig.java")
 
         # Add bean
-        bean_snippet_path = self.template_dir / 'config_snippets' / 'RestClientConfig.bean.java'
-        bean_snippet = self._read_template(bean_snippet_path)
-        bean_code = self._apply_replacements(bean_snippet)
+        bean_code = self._rest_bean_code
 
-        if f"{self.api_name_camel}Api()" not in content:
-            # Find the last @Bean method and insert after it
-            bean_pattern = re.compile(r'@Bean\s+public\s+\w+.*?\n\s+\}', re.DOTALL)
-            beans = list(bean_pattern.finditer(content))
-
-            if beans:
-                # Insert after the last bean
-                last_bean = beans[-1]
-                insert_pos = last_bean.end()
-                content = content[:insert_pos] + "\n" + bean_code + content[insert_pos:]
-                click.echo(f"✓ Added bean to RestClientConfig.java (after last bean)")
+        if not bean_present:
+            # Insert after the last @Bean method
+            insert_pos = last_bean_end
+
+            if insert_pos != -1:
+                edits.append((insert_pos, '\n' + bean_code))
+                self._emit(f"✓ Added bean to RestClientConfig.java (after last bean)")
             else:
                 # Fallback: insert before class closing brace
-                class_match = re.search(r'(  \}\n)(\}\s*$)', content)
-                if class_match:
-                    insert_pos = class_match.start(1) + len(class_match.group(1))
-                    content = content[:insert_pos] + bean_code + "\n" + content[insert_pos:]
-                    click.echo(f"✓ Added bean to RestClientConfig.java")
+                insert_pos = self._find_class_closing_brace(content)
+                if insert_pos != -1:
+                    edits.append((insert_pos, bean_code + '\n'))
+                    self._emit(f"✓ Added bean to RestClientConfig.java")
 
-        config_path.write_text(content, encoding='utf-8')
+        if edits:
+            config_path.write_text(self._apply_edits(content, edits), encoding='utf-8')
 
-    def _add_to_endpoints_config(self):
+    def _add_to_endpoints_config(self, config_path: Path):
         """Add bean to EndpointsConfig.java."""
-        config_path = self.src_path / 'config' / 'endpoints' / 'EndpointsConfig.java'
-
-        if not config_path.exists():
-            click.echo(f"⚠️  EndpointsConfig.java not found at default location, searching...")
-            config_path = self._find_file_recursive('EndpointsConfig.java', self.project_root)
-            if not config_path:
-                click.echo(f"⚠️  EndpointsConfig.java not found in project")
-                return
+        if not config_path:
+            self._emit(f"⚠️  EndpointsConfig.java not found in project")
+            return
 
         content = config_path.read_text(encoding='utf-8')
 
+        edits = []
+
         # Add bean
-        bean_snippet_path = self.template_dir / 'config_snippets' / 'EndpointsConfig.bean.java'
-        bean_snippet = self._read_template(bean_snippet_path)
-        bean_code = self._apply_replacements(bean_snippet)
+        bean_code = self._endpoints_bean_code
 
         if f"{self.api_name_camel}Endpoint()" not in content:
             # Find the last @Bean method and insert after it
-            bean_pattern = re.compile(r'@Bean\s+.*?\n\s+\}', re.DOTALL)
-            beans = list(bean_pattern.finditer(content))
-
-            if beans:
-                # Insert after the last bean
-                last_bean = beans[-1]
-                insert_pos = last_bean.end()
-                content = content[:insert_pos] + "\n" + bean_code + content[insert_pos:]
-                click.echo(f"✓ Added bean to EndpointsConfig.java (after last bean)")
+            insert_pos = self._last_match_end(_BEAN_RE_ENDPOINTS, content)
+
+            if insert_pos != -1:
+                edits.append((insert_pos, '\n' + bean_code))
+                self._emit(f"✓ Added bean to EndpointsConfig.java (after last bean)")
             else:
                 # Fallback: insert before class closing brace
-                class_match = re.search(r'(  \}\n)(\}\s*$)', content)
-                if class_match:
-                    insert_pos = class_match.start(1) + len(class_match.group(1))
-                    content = content[:insert_pos] + bean_code + "\n" + content[insert_pos:]
-                    click.echo(f"✓ Added bean to EndpointsConfig.java")
-
-        config_path.write_text(content, encoding='utf-8')
-
-    def _find_file_recursive(self, filename: str, search_path: Path) -> Path:
-        """Recursively search for a file in the project."""
-        for root, dirs, files in os.walk(search_path):
-            if filename in files:
-                found_path = Path(root) / filename
-                click.echo(f"✓ Found {filename} at {found_path.relative_to(self.project_root)}")
-                return found_path
-        return None
+                insert_pos = self._find_class_closing_brace(content)
+                if insert_pos != -1:
+                    edits.append((insert_pos, bean_code + '\n'))
+                    self._emit(f"✓ Added bean to EndpointsConfig.java")
+
+        if edits:
+            config_path.write_text(self._apply_edits(content, edits), encoding='utf-8')
+
+    def _find_file_recursive(self, filenames, search_path: Path) -> Dict[str, Path]:
+        """Recursively search for files in the project, returning a name -> path dict.
+
+        The src/main subtree is searched first since config files live there.
+        The rest of search_path is searched next, skipping build output and
+        tooling directories. Package directories under src/main are never
+        pruned by name, because 'build' or 'bin' can be valid package names.
+        Names that aren't found are left out of the result.
+        """
+        preferred = search_path / 'src' / 'main'
+        found = {}
+        if preferred.is_dir():
+            found = self._scan_for_files(filenames, preferred)
+        remaining = [filename for filename in filenames if filename not in found]
+        if remaining:
+            found.update(self._scan_for_files(remaining, search_path, self._PRUNED_DIRS, skip=preferred))
+
+        for filename in filenames:
+            if filename in found:
+                self._emit(f"✓ Found {filename} at {found[filename].relative_to(self.project_root)}")
+        return found
+
+    @staticmethod
+    def _scan_for_files(filenames, root: Path, pruned=frozenset(), skip: Path = None) -> Dict[str, Path]:
+        """Depth-first scandir search for the first file with each of ``filenames``.
+
+        Hidden directories, directories named in ``pruned`` and ``skip`` are
+        not entered. The walk stops as soon as every name has been found.
+        """
+        wanted = set(filenames)
+        found = {}
+        skip_path = os.fspath(skip) if skip is not None else None
+        stack = [os.fspath(root)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (not entry.name.startswith('.') and entry.name not in pruned
+                                and entry.path != skip_path):
+                            stack.append(entry.path)
+                    elif entry.name in wanted and entry.name not in found and entry.is_file():
+                        found[entry.name] = Path(entry.path)
+                        if len(found) == len(wanted):
+                            return found
+        return found
 
-    def _add_to_application_yaml(self):
+    @staticmethod
+    def _yaml_block_end(text: str, header) -> int:
+        """Return the offset just past the last indented line of a top-level section."""
+        next_key = _YAML_TOP_LEVEL_RE.search(text, header.end() + 1)
+        block_end = next_key.start() if next_key else len(text)
+        last_line_end = 0
+        for line in _YAML_NESTED_LINE_RE.finditer(text, header.end(), block_end):
+            last_line_end = line.end()
+        return last_line_end or header.end()
+
+    def _append_service_to_yaml_text(self, yaml_path: Path, text: str, existing):
+        """Add the service block to application-local.yml without a YAML round-trip.
+
+        ``existing`` is the document as parsed by ``_safe_load_yaml``. Missing
+        http-client globals and the credentials entry are injected as
+        preformatted text at the end of their sections, which are appended to
+        the file when absent. Returns True once handled, or None when the file
+        or the values use constructs the text edit can't write safely (anchors,
+        merge keys, document markers, flow mappings, non two-space indentation,
+        keys or values that need quoting) and the full ruamel.yaml path is
+        needed.
+        """
+        if '<<:' in text or '&' in text or not isinstance(existing, dict):
+            return None
+        # Appending past a document end or separator would start another document;
+        # only a '---' ahead of all content is fine
+        for marker in _YAML_DOCUMENT_MARKER_RE.finditer(text):
+            if marker.group() == '...' or _YAML_TOP_LEVEL_RE.search(text, 0, marker.start()):
+                return None
+        if not _is_plain_yaml_string(self.base_url, _YAML_PLAIN_SCALAR_RE):
+            return None
+        if not all(map(_is_plain_yaml_string, [self.service_identifier, *(self.credentials or ())])):
+            return None
+
+        headers = {}
+        children = {}
+        for section, header_re in _YAML_SECTION_HEADER_RES.items():
+            header = header_re.search(text)
+            value = existing.get(section)
+            if header is None:
+                # Present but spelled in a way the text edit doesn't recognise
+                if section in existing:
+                    return None
+                value = {}
+            elif value is None:
+                value = {}
+            elif not isinstance(value, dict):
+                return None
+            else:
+                # Only edit sections whose keys are indented by exactly two spaces
+                body = text[header.end():self._yaml_block_end(text, header)]
+                first_key = re.search(r'^( *)[^\s#]', body, re.MULTILINE)
+                if first_key is None or first_key.group(1) != '  ':
+                    return None
+            headers[section] = header
+            children[section] = value
+
+        http_client = children['http-client']
+        if self.service_identifier in http_client:
+            self._emit(f"⚠️  Configuration for {self.service_identifier} already exists in YAML")
+            return True
+
+        lines = []
+        for prop, default in (('timeout', 30), ('logging-level', 'BODY'), ('connect-timeout', 10)):
+            if prop not in http_client:
+                lines.append(f"  {prop}: {default}")
+                self._emit(f"✓ Added default http-client.{prop} property")
+        lines.append(self._yaml_service_block)
+
+        edits = []
+        appended = []
+        if headers['http-client'] is not None:
+            edits.append((self._yaml_block_end(text, headers['http-client']), '\n' + '\n'.join(lines)))
+        else:
+            appended.append('http-client:')
+            appended.extend(lines)
+
+        if self.credentials:
+            if self.service_identifier in children['credentials']:
+                self._emit(f"⚠️  Credentials for {self.service_identifier} already exist in YAML")
+            else:
+                creds = [f"  {self.service_identifier}:"]
+                creds.extend(f"    {field}: TODO_ADD_VALUE" for field in self.credentials)
+                if headers['credentials'] is not None:
+                    edits.append((self._yaml_block_end(text, headers['credentials']), '\n' + '\n'.join(creds)))
+                else:
+                    appended.append('credentials:')
+                    appended.extend(creds)
+                self._emit(f"✓ Added credentials section for {self.service_identifier}")
+
+        if appended:
+            lead = '\n' if text and not text.endswith('\n') else ''
+            edits.append((len(text), lead + '\n'.join(appended) + '\n'))
+
+        output = self._apply_edits(text, edits)
+        _pending_yaml[yaml_path] = output if output.endswith('\n') else output + '\n'
+
+        self._emit(f"✓ Added configuration to application-local.yml")
+        return True
+
+    def _add_to_application_yaml(self, yaml_path: Path):
         """Add configuration block to application-local.yml."""
-        yaml_path = self.project_root / 'src' / 'main' / 'resources' / 'application-local.yml'
+        if not yaml_path:
+            self._emit(f"⚠️  application-local.yml not found in project")
+            return
+
+        text = _load_yaml_text(yaml_path)
+        # Parse once with the fast safe loader, for the text edit and for the
+        # existence check; the comment-preserving round-trip loader is only
+        # needed once we know the file will be rewritten through it
+        existing = _safe_load_yaml(text)
+        if self._append_service_to_yaml_text(yaml_path, text, existing):
+            return
 
-        if not yaml_path.exists():
-            click.echo(f"⚠️  application-local.yml not found at default location, searching...")
-            yaml_path = self._find_file_recursive('application-local.yml', self.project_root)
-            if not yaml_path:
-                click.echo(f"⚠️  application-local.yml not found in project")
+        YAML = _get_yaml_class()
+        if isinstance(existing, dict):
+            http_client = existing.get('http-client')
+            if isinstance(http_client, dict) and self.service_identifier in http_client:
+                self._emit(f"⚠️  Configuration for {self.service_identifier} already exists in YAML")
                 return
 
         yaml = YAML()
         yaml.preserve_quotes = True
         yaml.default_flow_style = False
-
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.load(f)
+        data = yaml.load(text)
 
         if data is None:
             data = {}
@@ -340,19 +786,19 @@ class RetrofitClientGenerator:
         # Ensure global properties exist
         if 'timeout' not in data['http-client']:
             data['http-client']['timeout'] = 30
-            click.echo(f"✓ Added default http-client.timeout property")
+            self._emit(f"✓ Added default http-client.timeout property")
 
         if 'logging-level' not in data['http-client']:
             data['http-client']['logging-level'] = 'BODY'
-            click.echo(f"✓ Added default http-client.logging-level property")
+            self._emit(f"✓ Added default http-client.logging-level property")
 
         if 'connect-timeout' not in data['http-client']:
             data['http-client']['connect-timeout'] = 10
-            click.echo(f"✓ Added default http-client.connect-timeout property")
+            self._emit(f"✓ Added default http-client.connect-timeout property")
 
         # Check if service already configured
         if self.service_identifier in data['http-client']:
-            click.echo(f"⚠️  Configuration for {self.service_identifier} already exists in YAML")
+            self._emit(f"⚠️  Configuration for {self.service_identifier} already exists in YAML")
             return
 
         # Add service configuration
@@ -370,26 +816,81 @@ class RetrofitClientGenerator:
 
             # Check if credentials for this service already exist
             if self.service_identifier in data['credentials']:
-                click.echo(f"⚠️  Credentials for {self.service_identifier} already exist in YAML")
+                self._emit(f"⚠️  Credentials for {self.service_identifier} already exist in YAML")
             else:
                 credentials_dict = {}
                 for field in self.credentials:
                     credentials_dict[field] = 'TODO_ADD_VALUE'
 
                 data['credentials'][self.service_identifier] = credentials_dict
-                click.echo(f"✓ Added credentials section for {self.service_identifier}")
+                self._emit(f"✓ Added credentials section for {self.service_identifier}")
 
-        with open(yaml_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f)
+        output = io.StringIO()
+        yaml.dump(data, output)
+        _pending_yaml[yaml_path] = output.getvalue()
 
-        click.echo(f"✓ Added configuration to application-local.yml")
+        self._emit(f"✓ Added configuration to application-local.yml")
 
 
 def _generate_service_identifier(api_name: str) -> str:
     """Generate kebab-case service identifier from PascalCase API name."""
-    import re
-    kebab = re.sub(r'(?<!^)(?=[A-Z])', '-', api_name)
-    return f"{kebab.lower()}-api"
+    return f"{_KEBAB_RE.sub('-', api_name).lower()}-api"
+
+
+def _load_batch_config(config_path: str) -> list:
+    """Load API definitions for batch generation from a JSON or TOML file.
+
+    The file holds a list of entries, either at the top level (JSON) or under
+    an ``apis`` key. Entry keys mirror the command-line options: ``api-name``,
+    ``endpoint-path`` and ``base-url`` are required, ``service-identifier``
+    and ``credentials`` (list or comma-separated string) are optional.
+    """
+    path = Path(config_path)
+    if path.suffix == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError("TOML config files require Python 3.11+ or the 'tomli' package")
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    entries = data.get('apis') if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"{path.name} must define a non-empty list of APIs")
+
+    apis = []
+    for index, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"API #{index} in {path.name} must be a table/object")
+        options = {str(key).replace('_', '-'): value for key, value in entry.items()}
+
+        missing = [key for key in ('api-name', 'endpoint-path', 'base-url') if not options.get(key)]
+        if missing:
+            raise ValueError(f"API #{index} in {path.name} is missing: {', '.join(missing)}")
+        not_strings = [key for key in ('api-name', 'endpoint-path', 'base-url', 'service-identifier')
+                       if options.get(key) is not None and not isinstance(options[key], str)]
+        if not_strings:
+            raise ValueError(f"API #{index} in {path.name} must use strings for: {', '.join(not_strings)}")
+        credentials = options.get('credentials') or []
+        if isinstance(credentials, str):
+            credentials = credentials.split(',')
+        credential_list = [str(field).strip() for field in credentials if str(field).strip()]
+
+        apis.append({
+            'api_name': options['api-name'],
+            'endpoint_path': options['endpoint-path'],
+            'base_url': options['base-url'],
+            'service_identifier': (options.get('service-identifier')
+                                   or _generate_service_identifier(options['api-name'])),
+            'credentials': credential_list or None,
+        })
+    return apis
 
 
 @click.command()
@@ -398,7 +899,9 @@ def _generate_service_identifier(api_name: str) -> str:
 @click.option('--base-url', default=None, help='Base URL (e.g., https://api.example.com/)')
 @click.option('--service-identifier', default=None, help='YAML property identifier (e.g., user-service-api). If not provided, auto-generated from api-name')
 @click.option('--credentials', default=None, help='Comma-separated credential field names (e.g., api-key,token). Omit if no credentials needed')
-def main(api_name, endpoint_path, base_url, service_identifier, credentials):
+@click.option('--config', 'config_file', default=None, type=click.Path(exists=True, dir_okay=False),
+              help='JSON or TOML file listing several APIs to generate in one run')
+def main(api_name, endpoint_path, base_url, service_identifier, credentials, config_file):
     """
     Generate a complete Retrofit API client for Java/Spring Boot projects.
 
@@ -414,7 +917,15 @@ def main(api_name, endpoint_path, base_url, service_identifier, credentials):
 
       # With credentials
       retrofit-generator --api-name=PaymentGateway --endpoint-path=v1/payments --base-url=https://pay.example.com/ --credentials=api-key,secret-key
+
+      # Batch mode
+      retrofit-generator --config=apis.toml
     """
+    if not _yaml_installed():
+        print("Error: Required dependencies not installed.")
+        print("Please run: pip install retrofit-generator")
+        sys.exit(1)
+
     try:
         project_root = Path.cwd()
 
@@ -424,6 +935,23 @@ def main(api_name, endpoint_path, base_url, service_identifier, credentials):
             click.echo("The package may not be installed correctly.", err=True)
             sys.exit(1)
 
+        # Batch mode: generate every API from the config file in this process
+        if config_file:
+            if any(value is not None for value in (api_name, endpoint_path, base_url,
+                                                   service_identifier, credentials)):
+                raise ValueError("--config cannot be combined with per-API options")
+            try:
+                for api in _load_batch_config(config_file):
+                    generator = RetrofitClientGenerator(
+                        project_root=project_root,
+                        template_dir=TEMPLATE_DIR,
+                        **api
+                    )
+                    generator.generate_all(flush_yaml=False)
+            finally:
+                _flush_yaml()
+            return
+
         # Detect if running in interactive mode
         interactive_mode = not (api_name and endpoint_path and base_url)
 
@@ -0,0 +1,350 @@
+"""Tests for RetrofitClientGenerator and the retrofit-generator command."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from click.testing import CliRunner
+from ruamel.yaml import YAML
+
+from retrofit_generator import cli
+
+APPLICATION_YML = """\
+http-client:
+  timeout: 30
+  logging-level: BODY
+  connect-timeout: 10
+  foo-api:
+    base-url: https://foo/
+"""
+
+REST_CLIENT_CONFIG = """\
+package com.example.config;
+
+{imports}
+
+public class RestClientConfig {{
+
+  @Bean
+  public FooApi fooApi(EndpointsConfig.Endpoint fooEndpoint, OkHttpClient okHttpClient) {{
+    return createRestClient(FooApi.class, fooEndpoint, okHttpClient);
+  }}
+}}
+"""
+
+
+class GeneratorTestCase(unittest.TestCase):
+    """Builds a minimal Spring project in a temporary directory."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.project_root = Path(tmp.name)
+        (self.project_root / 'src' / 'main' / 'java' / 'com' / 'example' / 'client').mkdir(parents=True)
+        (self.project_root / 'src' / 'main' / 'resources').mkdir(parents=True)
+        cli.RetrofitClientGenerator._base_package_cache.clear()
+        self.addCleanup(cli._pending_yaml.clear)
+
+    def run_cli(self, *args):
+        """Invoke the command from the project root, as a user would."""
+        cwd = os.getcwd()
+        os.chdir(self.project_root)
+        try:
+            return CliRunner().invoke(cli.main, list(args))
+        finally:
+            os.chdir(cwd)
+
+    def make_generator(self, service_identifier='map-box-api', credentials=None):
+        return cli.RetrofitClientGenerator(
+            api_name='MapBox',
+            endpoint_path='api/v1/geo',
+            base_url='https://api.mapbox.com/',
+            service_identifier=service_identifier,
+            project_root=self.project_root,
+            template_dir=cli.TEMPLATE_DIR,
+            credentials=credentials,
+        )
+
+
+class RestClientConfigTest(GeneratorTestCase):
+
+    def add_bean(self, content):
+        config_path = self.project_root / 'RestClientConfig.java'
+        config_path.write_text(content, encoding='utf-8')
+        self.make_generator()._add_to_rest_client_config(config_path)
+        return config_path.read_text(encoding='utf-8')
+
+    def test_import_is_added_once(self):
+        content = self.add_bean(REST_CLIENT_CONFIG.format(imports='import okhttp3.OkHttpClient;'))
+        self.assertEqual(content.count('import com.example.client.rest.api.MapBoxApi;'), 1)
+        self.assertIn('public MapBoxApi mapBoxApi(', content)
+
+    def test_commented_import_counts_as_present(self):
+        imports = 'import okhttp3.OkHttpClient;\nimport com.example.client.rest.api.MapBoxApi; // added by hand'
+        content = self.add_bean(REST_CLIENT_CONFIG.format(imports=imports))
+        self.assertEqual(content.count('import com.example.client.rest.api.MapBoxApi;'), 1)
+
+
+class ApplicationYamlTest(GeneratorTestCase):
+
+    def add_service(self, service_identifier, credentials=None):
+        yaml_path = self.project_root / 'src' / 'main' / 'resources' / 'application-local.yml'
+        yaml_path.write_text(APPLICATION_YML, encoding='utf-8')
+        generator = self.make_generator(service_identifier, credentials)
+        generator._add_to_application_yaml(yaml_path)
+        cli._flush_yaml()
+        return YAML(typ='safe').load(yaml_path.read_text(encoding='utf-8'))
+
+    def test_plain_identifier_is_added(self):
+        data = self.add_service('map-box-api', credentials=['api-key'])
+        self.assertEqual(data['http-client']['map-box-api']['base-url'], 'https://api.mapbox.com/')
+        self.assertEqual(data['credentials']['map-box-api'], {'api-key': 'TODO_ADD_VALUE'})
+        self.assertIn('foo-api', data['http-client'])
+
+    def test_identifier_needing_quotes_stays_valid(self):
+        data = self.add_service('weird id: x', credentials=['api-key'])
+        self.assertIn('weird id: x', data['http-client'])
+        self.assertIn('weird id: x', data['credentials'])
+
+    def test_numeric_identifier_stays_a_string(self):
+        data = self.add_service('123')
+        self.assertIn('123', data['http-client'])
+        self.assertNotIn(123, data['http-client'])
+
+    def test_bool_like_identifier_stays_a_string(self):
+        data = self.add_service('yes')
+        self.assertIn('yes', data['http-client'])
+        self.assertNotIn(True, data['http-client'])
+
+
+SERVICE_BLOCK = """\
+  map-box-api:
+    base-url: https://api.mapbox.com/
+    logging-level: ${http-client.logging-level}
+    read-timeout: ${http-client.timeout}
+    connect-timeout: ${http-client.connect-timeout}
+"""
+
+GLOBALS_BLOCK = """\
+  timeout: 30
+  logging-level: BODY
+  connect-timeout: 10
+"""
+
+
+class YamlTextEditTest(GeneratorTestCase):
+    """Structural cases of the application-local.yml text edit and its fallbacks."""
+
+    def setUp(self):
+        super().setUp()
+        self.yaml_path = self.project_root / 'src' / 'main' / 'resources' / 'application-local.yml'
+
+    def edit(self, text, credentials=None):
+        """Run only the text edit; returns its result and the edited text, if any."""
+        self.yaml_path.write_text(text, encoding='utf-8')
+        generator = self.make_generator(credentials=credentials)
+        handled = generator._append_service_to_yaml_text(self.yaml_path, text, cli._safe_load_yaml(text))
+        return handled, cli._pending_yaml.pop(self.yaml_path, None)
+
+    def add_service(self, text, *service_identifiers):
+        """Run the full YAML step for each identifier and load the result."""
+        self.yaml_path.write_text(text, encoding='utf-8')
+        for service_identifier in service_identifiers:
+            self.make_generator(service_identifier)._add_to_application_yaml(self.yaml_path)
+            cli._flush_yaml()
+        return YAML(typ='safe').load(self.yaml_path.read_text(encoding='utf-8'))
+
+    def test_missing_sections_are_appended(self):
+        handled, output = self.edit("server:\n  port: 8080\n", credentials=['api-key'])
+        self.assertTrue(handled)
+        self.assertEqual(output, (
+            "server:\n  port: 8080\nhttp-client:\n" + GLOBALS_BLOCK + SERVICE_BLOCK
+            + "credentials:\n  map-box-api:\n    api-key: TODO_ADD_VALUE\n"
+        ))
+
+    def test_empty_file(self):
+        handled, output = self.edit("")
+        self.assertTrue(handled)
+        self.assertEqual(output, "http-client:\n" + GLOBALS_BLOCK + SERVICE_BLOCK)
+
+    def test_null_sections_are_filled_in_place(self):
+        handled, output = self.edit("http-client:\ncredentials:\nother: 1\n", credentials=['api-key'])
+        self.assertTrue(handled)
+        self.assertEqual(output, (
+            "http-client:\n" + GLOBALS_BLOCK + SERVICE_BLOCK
+            + "credentials:\n  map-box-api:\n    api-key: TODO_ADD_VALUE\nother: 1\n"
+        ))
+
+    def test_missing_global_properties_are_injected(self):
+        text = "http-client:\n  foo-api:\n    base-url: https://foo/\nother: 1\n"
+        handled, output = self.edit(text)
+        self.assertTrue(handled)
+        self.assertEqual(output, (
+            "http-client:\n  foo-api:\n    base-url: https://foo/\n" + GLOBALS_BLOCK + SERVICE_BLOCK
+            + "other: 1\n"
+        ))
+
+    def test_existing_credentials_section_is_extended(self):
+        text = "credentials:\n  foo-api:\n    key: value\nhttp-client:\n" + GLOBALS_BLOCK
+        handled, output = self.edit(text, credentials=['api-key', 'token'])
+        self.assertTrue(handled)
+        self.assertEqual(output, (
+            "credentials:\n  foo-api:\n    key: value\n"
+            "  map-box-api:\n    api-key: TODO_ADD_VALUE\n    token: TODO_ADD_VALUE\n"
+            "http-client:\n" + GLOBALS_BLOCK + SERVICE_BLOCK
+        ))
+
+    def test_comments_stay_in_place(self):
+        text = (
+            "# local profile\n"
+            "http-client:  # clients\n" + GLOBALS_BLOCK + "  # more clients below\n"
+            "# unrelated settings\n"
+            "other:\n  key: value  # inline\n"
+        )
+        handled, output = self.edit(text)
+        self.assertTrue(handled)
+        self.assertEqual(output, (
+            "# local profile\n"
+            "http-client:  # clients\n" + GLOBALS_BLOCK + "  # more clients below\n" + SERVICE_BLOCK
+            + "# unrelated settings\n"
+            "other:\n  key: value  # inline\n"
+        ))
+
+    def test_leading_document_start_marker_is_kept(self):
+        handled, output = self.edit("---\nhttp-client:\n" + GLOBALS_BLOCK)
+        self.assertTrue(handled)
+        self.assertEqual(output, "---\nhttp-client:\n" + GLOBALS_BLOCK + SERVICE_BLOCK)
+
+    def test_existing_service_is_left_alone(self):
+        handled, output = self.edit(APPLICATION_YML.replace('foo-api', 'map-box-api'))
+        self.assertTrue(handled)
+        self.assertIsNone(output)
+
+    def test_unsupported_layouts_fall_back_to_ruamel(self):
+        cases = {
+            'anchor': "defaults: &defaults\n  timeout: 30\nhttp-client:\n  timeout: 30\n",
+            'merge key': "http-client:\n  <<: {timeout: 30}\n  logging-level: BODY\n",
+            'flow mapping': "http-client: {timeout: 30, logging-level: BODY}\n",
+            'four-space indent': "http-client:\n    timeout: 30\n    logging-level: BODY\n",
+            'document end marker': "http-client:\n" + GLOBALS_BLOCK + "...\n",
+        }
+        for name, text in cases.items():
+            with self.subTest(name):
+                handled, output = self.edit(text)
+                self.assertIsNone(handled)
+                self.assertIsNone(output)
+
+                data = self.add_service(text, 'map-box-api')
+                self.assertEqual(data['http-client']['map-box-api']['base-url'], 'https://api.mapbox.com/')
+                self.assertEqual(data['http-client']['timeout'], 30)
+
+    def test_document_end_marker_survives_repeated_runs(self):
+        data = self.add_service("http-client:\n" + GLOBALS_BLOCK + "...\n", 'map-box-api', 'user-service-api')
+        self.assertIn('map-box-api', data['http-client'])
+        self.assertIn('user-service-api', data['http-client'])
+
+
+class BatchConfigTest(GeneratorTestCase):
+    """--config loading and batch runs."""
+
+    def write_config(self, name, content):
+        path = self.project_root / name
+        path.write_text(content, encoding='utf-8')
+        return str(path)
+
+    def test_json_list(self):
+        path = self.write_config('apis.json', (
+            '[{"api-name": "MapBox", "endpoint-path": "api/v1/geo",'
+            ' "base-url": "https://api.mapbox.com/", "credentials": "api-key, token"}]'
+        ))
+        self.assertEqual(cli._load_batch_config(path), [{
+            'api_name': 'MapBox',
+            'endpoint_path': 'api/v1/geo',
+            'base_url': 'https://api.mapbox.com/',
+            'service_identifier': 'map-box-api',
+            'credentials': ['api-key', 'token'],
+        }])
+
+    def test_json_apis_key(self):
+        path = self.write_config('apis.json', (
+            '{"apis": [{"api-name": "MapBox", "endpoint-path": "api/v1/geo",'
+            ' "base-url": "https://api.mapbox.com/", "service-identifier": "geo-api"}]}'
+        ))
+        [api] = cli._load_batch_config(path)
+        self.assertEqual(api['service_identifier'], 'geo-api')
+        self.assertIsNone(api['credentials'])
+
+    def test_toml_with_underscore_keys(self):
+        path = self.write_config('apis.toml', (
+            '[[apis]]\n'
+            'api_name = "MapBox"\n'
+            'endpoint_path = "api/v1/geo"\n'
+            'base_url = "https://api.mapbox.com/"\n'
+            'credentials = ["api-key"]\n'
+        ))
+        try:
+            apis = cli._load_batch_config(path)
+        except ValueError as e:
+            self.skipTest(str(e))
+        self.assertEqual(apis, [{
+            'api_name': 'MapBox',
+            'endpoint_path': 'api/v1/geo',
+            'base_url': 'https://api.mapbox.com/',
+            'service_identifier': 'map-box-api',
+            'credentials': ['api-key'],
+        }])
+
+    def test_missing_field(self):
+        path = self.write_config('apis.json', '[{"api-name": "MapBox", "base-url": "https://x/"}]')
+        with self.assertRaisesRegex(ValueError, 'API #1 in apis.json is missing: endpoint-path'):
+            cli._load_batch_config(path)
+
+    def test_non_string_field(self):
+        path = self.write_config('apis.json', (
+            '[{"api-name": "MapBox", "endpoint-path": "a", "base-url": "https://x/"},'
+            ' {"api-name": "Other", "endpoint-path": ["a"], "base-url": "https://x/", "service-identifier": 1}]'
+        ))
+        with self.assertRaisesRegex(ValueError,
+                                    'API #2 in apis.json must use strings for: endpoint-path, service-identifier'):
+            cli._load_batch_config(path)
+
+    def test_config_cannot_be_combined_with_options(self):
+        path = self.write_config('apis.json', '[]')
+        result = self.run_cli('--config', path, '--api-name=MapBox')
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('--config cannot be combined with per-API options', result.output)
+
+    def test_batch_run_writes_yaml_once(self):
+        yaml_path = self.project_root / 'src' / 'main' / 'resources' / 'application-local.yml'
+        yaml_path.write_text(APPLICATION_YML, encoding='utf-8')
+        path = self.write_config('apis.json', (
+            '[{"api-name": "MapBox", "endpoint-path": "api/v1/geo", "base-url": "https://api.mapbox.com/"},'
+            ' {"api-name": "UserService", "endpoint-path": "api/v1/users", "base-url": "https://users/"}]'
+        ))
+        write_text = Path.write_text
+        with mock.patch.object(Path, 'write_text', autospec=True, side_effect=write_text) as mocked:
+            result = self.run_cli('--config', path)
+        self.assertEqual(result.exit_code, 0, result.output)
+        yaml_writes = [call for call in mocked.call_args_list if call.args[0] == yaml_path]
+        self.assertEqual(len(yaml_writes), 1)
+        data = YAML(typ='safe').load(yaml_path.read_text(encoding='utf-8'))
+        self.assertIn('map-box-api', data['http-client'])
+        self.assertIn('user-service-api', data['http-client'])
+
+
+class DependencyCheckTest(GeneratorTestCase):
+
+    def test_missing_ruamel_stops_before_writing(self):
+        with mock.patch.object(cli, '_yaml_installed', return_value=False):
+            result = self.run_cli('--api-name=MapBox', '--endpoint-path=a', '--base-url=https://x/',
+                                  '--service-identifier=map-box-api', '--credentials=')
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Required dependencies not installed', result.output)
+        client_dir = self.project_root / 'src' / 'main' / 'java' / 'com' / 'example' / 'client'
+        self.assertEqual(list(client_dir.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()